@@ -33,18 +33,6 @@ def process_and_validate_data(data):
 
 # ---------- Fixtures for setup and teardown ----------
 
-@pytest.fixture(scope="module", autouse=True)
-def setup_and_teardown_module():
-    """
-    Module-level setup and teardown.
-    Could include DB connections, environment prep, etc.
-    """
-    # Setup code here
-    print("\n[SETUP] Initialize resources for data processing tests")
-    yield
-    # Teardown code here
-    print("\n[TEARDOWN] Clean up resources after tests")
-
 @pytest.fixture(autouse=True)
 def setup_and_teardown_test():
     """
@@ -177,6 +165,6 @@ def test_value_rounding():
 
 - Adjust the example `process_and_validate_data` according to your actual implementation.
 - Each test case includes clear comments explaining the scenario.
-- Setup and teardown are provided for both module and function scopes.
+- Per-test setup and teardown is provided by a function-scoped fixture.
 - Edge cases and boundary values are thoroughly tested.
 - Use `pytest` to run the tests: `pytest test_data_processing.py` (where this code is saved).
\ No newline at end of file
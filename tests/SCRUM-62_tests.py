@@ -35,13 +35,11 @@ def extractor(sample_source_document, monkeypatch):
             # Simulate RAG filling missing data
             filled = []
             for req in self.source_document:
-                filled_req = req.copy()
                 # Simulate RAG filling for missing fields
-                if not filled_req.get("description"):
-                    filled_req["description"] = "Auto-filled description by RAG"
-                if not filled_req.get("title"):
-                    filled_req["title"] = "Auto-filled title by RAG"
-                filled.append(filled_req)
+                filled.append(req | {
+                    "description": req.get("description") or "Auto-filled description by RAG",
+                    "title": req.get("title") or "Auto-filled title by RAG",
+                })
             return filled
 
     return MockRAGRequirementExtractor(sample_source_document)
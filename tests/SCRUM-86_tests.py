@@ -10,92 +10,61 @@ Assumptions:
 ```python
 import pytest
 
-# Assume these are imported from the actual implementation
-from mymodule.notifications import send_task_notification, EmailService
+from _helpers import assert_contains_all
 
-@pytest.fixture
-def mock_email_service(monkeypatch):
-    """
-    Fixture to mock email sending service.
-    """
-    sent_emails = []
+# mock_email_service comes from tests/conftest.py
 
-    def mock_send_email(to, subject, body):
-        sent_emails.append({
-            'to': to,
-            'subject': subject,
-            'body': body
-        })
-        return True
+# Shared, read-only test data
+USER_EMAIL = "user@example.com"
+ERROR_DETAILS = "Database connection timeout"
+SUGGESTIONS = "Check database server connectivity."
 
-    monkeypatch.setattr(EmailService, "send_email", mock_send_email)
-    return sent_emails
-
-@pytest.fixture(autouse=True)
-def setup_and_teardown():
-    """
-    General setup and teardown for each test.
-    """
-    # Setup: e.g., reset any global state, clear queues, etc.
-    yield
-    # Teardown: clean up resources if needed
+# (task_status, error_details, suggestions, subject keyword, details the body must carry)
+NOTIFICATION_CASES = [
+    ("success", None, None, "Task Completed", ("successfully completed",)),
+    ("failure", ERROR_DETAILS, SUGGESTIONS, "Task Failed", (ERROR_DETAILS, SUGGESTIONS)),
+    # Suggestions block should be omitted or handled gracefully
+    ("failure", "API returned 500 error", None, "Task Failed", ("API returned 500 error",)),
+    # Edge case: a failure alert must handle empty error details gracefully
+    ("failure", "", "Contact admin.", "Task Failed", ("Contact admin.",)),
+]
+NOTIFICATION_CASE_IDS = ["completed", "failed_detailed", "failed_no_suggestions", "failed_empty_details"]
 
-def test_email_sent_on_task_completion(mock_email_service):
+@pytest.fixture(scope="session")
+def send_task_notification():
     """
-    Test that an email notification is sent when a task is completed successfully.
+    Import the function under test on first use rather than at collection time.
     """
-    user_email = "user@example.com"
-    send_task_notification(task_status="success", user_email=user_email)
-
-    assert len(mock_email_service) == 1
-    email = mock_email_service[0]
-    assert email['to'] == user_email
-    assert "Task Completed" in email['subject']
-    assert "successfully completed" in email['body']
+    # Assume this is imported from the actual implementation
+    from mymodule.notifications import send_task_notification
+    return send_task_notification
 
-def test_email_sent_on_task_failure_with_details(mock_email_service):
+@pytest.mark.parametrize(
+    "task_status, error_details, suggestions, subject_keyword, body_needles",
+    NOTIFICATION_CASES,
+    ids=NOTIFICATION_CASE_IDS
+)
+def test_email_sent_for_task_status(send_task_notification, mock_email_service, task_status,
+                                    error_details, suggestions, subject_keyword, body_needles):
     """
-    Test that a failure alert email is sent with error details and suggested actions.
+    Test that a completion email or failure alert is sent with the expected
+    subject and body details, with or without suggested actions.
     """
-    user_email = "user@example.com"
-    error_details = "Database connection timeout"
-    suggestions = "Check database server connectivity."
-
     send_task_notification(
-        task_status="failure",
-        user_email=user_email,
+        task_status=task_status,
+        user_email=USER_EMAIL,
         error_details=error_details,
         suggestions=suggestions
     )
 
     assert len(mock_email_service) == 1
     email = mock_email_service[0]
-    assert email['to'] == user_email
-    assert "Task Failed" in email['subject']
-    assert error_details in email['body']
-    assert suggestions in email['body']
+    assert email['to'] == USER_EMAIL
+    assert subject_keyword in email['subject']
+    assert_contains_all(email['body'], *body_needles)
 
-def test_email_sent_on_task_failure_without_suggestions(mock_email_service):
-    """
-    Test that a failure alert email is sent even if suggested actions are missing.
-    """
-    user_email = "user@example.com"
-    error_details = "API returned 500 error"
-
-    send_task_notification(
-        task_status="failure",
-        user_email=user_email,
-        error_details=error_details
-        # suggestions is None
-    )
-
-    assert len(mock_email_service) == 1
-    email = mock_email_service[0]
-    assert "API returned 500 error" in email['body']
-    # Suggestions block should be omitted or handled gracefully
-
-@pytest.mark.parametrize("task_status", ["success", "failure"])
-def test_no_email_sent_if_email_missing(mock_email_service, task_status):
+@pytest.mark.parametrize("task_status", ["success", "failure"], ids=["completed", "failed"])
+def test_no_email_sent_if_email_missing(send_task_notification, mock_email_service, task_status):
     """
     Edge case: No email should be sent if the user_email is missing or empty.
     """
@@ -105,38 +74,21 @@ def test_no_email_sent_if_email_missing(mock_email_service, task_status):
     )
     assert len(mock_email_service) == 0
 
-def test_failure_email_with_empty_error_details(mock_email_service):
-    """
-    Edge case: Verify that a failure alert can handle empty error details gracefully.
-    """
-    user_email = "user@example.com"
-    send_task_notification(
-        task_status="failure",
-        user_email=user_email,
-        error_details="",  # Empty error details
-        suggestions="Contact admin."
-    )
-    assert len(mock_email_service) == 1
-    email = mock_email_service[0]
-    assert "Task Failed" in email['subject']
-    assert "Contact admin." in email['body']
-
-def test_multiple_notifications_sent(mock_email_service):
+@pytest.mark.slow
+def test_multiple_notifications_sent(send_task_notification, mock_email_service):
     """
     Test that multiple notifications are sent for multiple task events.
     """
-    user_email = "user@example.com"
-    send_task_notification(task_status="success", user_email=user_email)
+    send_task_notification(task_status="success", user_email=USER_EMAIL)
     send_task_notification(
         task_status="failure",
-        user_email=user_email,
+        user_email=USER_EMAIL,
         error_details="Timeout",
         suggestions="Retry task."
     )
     assert len(mock_email_service) == 2
-    subjects = [email['subject'] for email in mock_email_service]
-    assert any("Task Completed" in s for s in subjects)
-    assert any("Task Failed" in s for s in subjects)
+    subjects = "\n".join(email['subject'] for email in mock_email_service)
+    assert_contains_all(subjects, "Task Completed", "Task Failed")
 ```
 
 **Notes:**
@@ -9,12 +9,12 @@ Assumptions:
 
 ```python
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 # Assume these are the main interfaces to test
 from myproject.coverage_analysis import AzureAICoverageAnalyzer, extract_requirements, CoverageAnalysisResult
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def srs_document():
     # Simulated SRS content
     return """
@@ -23,12 +23,13 @@ def srs_document():
     3. The system shall log all actions.
     """
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def requirements(srs_document):
-    # Extract requirements from the provided SRS document
-    return extract_requirements(srs_document)
+    # Extract requirements from the provided SRS document once per session;
+    # a tuple keeps the shared value from being mutated by any test
+    return tuple(extract_requirements(srs_document))
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def test_suite():
     # Simulated test suite descriptions
     return [
@@ -37,102 +38,77 @@ def test_suite():
         {"id": 3, "description": "Ensure logging occurs on each user action."},
     ]
 
-@pytest.fixture(scope="function")
-def analyzer():
-    # Setup: instantiate the analyzer (mock connection to Azure)
+@pytest.fixture(scope="session")
+def analyzer(request):
+    # Setup: instantiate the analyzer once (mock connection to Azure);
+    # tests only mock its methods, so the instance can be shared
     analyzer = AzureAICoverageAnalyzer()
-    yield analyzer
-    # Teardown: close any connections if applicable
-    analyzer.cleanup()
-
-def test_coverage_analysis_main_functionality(analyzer, test_suite, requirements):
-    """
-    Test that Azure-hosted AI model performs coverage analysis and aligns with requirements.
-    """
-    # Mock AI model's response to simulate perfect coverage and alignment
-    with patch.object(analyzer, "analyze_coverage", return_value=CoverageAnalysisResult(
-        coverage_percentage=100.0,
-        aligned_requirements=requirements,
-        missing_requirements=[]
-    )):
-        result = analyzer.analyze_coverage(test_suite, requirements)
-        assert result.coverage_percentage == 100.0
-        assert set(result.aligned_requirements) == set(requirements)
-        assert result.missing_requirements == []
-
-def test_partial_coverage(analyzer, test_suite, requirements):
-    """
-    Test the scenario where some requirements are not covered by the test suite.
-    """
-    # Remove one test to simulate partial coverage
-    partial_test_suite = test_suite[:-1]
-    expected_missing = [requirements[-1]]  # Last requirement is not covered
-
-    with patch.object(analyzer, "analyze_coverage", return_value=CoverageAnalysisResult(
-        coverage_percentage=66.67,
-        aligned_requirements=requirements[:-1],
-        missing_requirements=expected_missing
-    )):
-        result = analyzer.analyze_coverage(partial_test_suite, requirements)
-        assert result.coverage_percentage == pytest.approx(66.67, 0.01)
-        assert set(result.aligned_requirements) == set(requirements[:-1])
-        assert result.missing_requirements == expected_missing
-
-def test_no_requirements(analyzer, test_suite):
-    """
-    Edge case: No requirements extracted from SRS.
-    """
-    empty_requirements = []
-    with patch.object(analyzer, "analyze_coverage", return_value=CoverageAnalysisResult(
-        coverage_percentage=0.0,
-        aligned_requirements=[],
-        missing_requirements=[]
-    )):
-        result = analyzer.analyze_coverage(test_suite, empty_requirements)
-        assert result.coverage_percentage == 0.0
-        assert result.aligned_requirements == []
-        assert result.missing_requirements == []
-
-def test_no_tests(analyzer, requirements):
+    # Mock the AI model once; tests set its return_value/side_effect directly
+    analyzer.analyze_coverage = MagicMock()
+    # Teardown: close any connections if applicable, at session end
+    request.addfinalizer(analyzer.cleanup)
+    return analyzer
+
+@pytest.fixture(autouse=True)
+def reset_ai_model(analyzer):
+    # Clear the previous test's configured response and recorded calls
+    analyzer.analyze_coverage.reset_mock(return_value=True, side_effect=True)
+
+# Each scenario maps (test_suite, requirements) to the analyzer inputs and the
+# expected (coverage_percentage, aligned_requirements, missing_requirements)
+COVERAGE_SCENARIOS = {
+    # AI model reports perfect coverage and alignment
+    "full": lambda suite, reqs: (suite, reqs, 100.0, reqs, []),
+    # Remove one test to simulate partial coverage; last requirement is not covered
+    "partial": lambda suite, reqs: (suite[:-1], reqs, 66.67, reqs[:-1], [reqs[-1]]),
+    # Edge case: No requirements extracted from SRS
+    "no_requirements": lambda suite, reqs: (suite, [], 0.0, [], []),
+    # Edge case: No tests in the suite
+    "no_tests": lambda suite, reqs: ([], reqs, 0.0, [], reqs),
+}
+
+@pytest.mark.parametrize("scenario", list(COVERAGE_SCENARIOS.values()), ids=list(COVERAGE_SCENARIOS))
+def test_coverage_analysis(analyzer, test_suite, requirements, scenario):
     """
-    Edge case: No tests in the suite.
+    Test that Azure-hosted AI model performs coverage analysis and reports
+    aligned and missing requirements for full, partial and empty inputs.
     """
-    empty_test_suite = []
-    with patch.object(analyzer, "analyze_coverage", return_value=CoverageAnalysisResult(
-        coverage_percentage=0.0,
-        aligned_requirements=[],
-        missing_requirements=requirements
-    )):
-        result = analyzer.analyze_coverage(empty_test_suite, requirements)
-        assert result.coverage_percentage == 0.0
-        assert result.aligned_requirements == []
-        assert set(result.missing_requirements) == set(requirements)
+    suite, reqs, percentage, aligned, missing = scenario(test_suite, requirements)
+    analyzer.analyze_coverage.return_value = CoverageAnalysisResult(
+        coverage_percentage=percentage,
+        aligned_requirements=aligned,
+        missing_requirements=missing
+    )
+    result = analyzer.analyze_coverage(suite, reqs)
+    assert result.coverage_percentage == pytest.approx(percentage, 0.01)
+    assert set(result.aligned_requirements) == set(aligned)
+    assert set(result.missing_requirements) == set(missing)
 
 def test_unaligned_ai_output(analyzer, test_suite, requirements):
     """
     Edge case: AI model returns requirements not present in SRS (false positives).
     """
     extra_requirement = "The system shall perform data backup daily."
-    incorrect_alignment = requirements + [extra_requirement]
+    incorrect_alignment = [*requirements, extra_requirement]
 
-    with patch.object(analyzer, "analyze_coverage", return_value=CoverageAnalysisResult(
+    analyzer.analyze_coverage.return_value = CoverageAnalysisResult(
         coverage_percentage=100.0,
         aligned_requirements=incorrect_alignment,
         missing_requirements=[]
-    )):
-        result = analyzer.analyze_coverage(test_suite, requirements)
-        # Only requirements from SRS should be considered aligned
-        assert all(r in requirements for r in result.aligned_requirements)
-        # No missing requirements if coverage is perfect
-        assert result.missing_requirements == []
+    )
+    result = analyzer.analyze_coverage(test_suite, requirements)
+    # Only requirements from SRS should be considered aligned
+    assert all(r in requirements for r in result.aligned_requirements)
+    # No missing requirements if coverage is perfect
+    assert result.missing_requirements == []
 
 def test_ai_analysis_failure(analyzer, test_suite, requirements):
     """
     Edge case: AI model or Azure service is unavailable.
     """
-    with patch.object(analyzer, "analyze_coverage", side_effect=ConnectionError("Azure unavailable")):
-        with pytest.raises(ConnectionError, match="Azure unavailable"):
-            analyzer.analyze_coverage(test_suite, requirements)
+    analyzer.analyze_coverage.side_effect = ConnectionError("Azure unavailable")
+    with pytest.raises(ConnectionError, match="Azure unavailable"):
+        analyzer.analyze_coverage(test_suite, requirements)
 ```
 
 **Notes:**
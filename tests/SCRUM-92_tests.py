@@ -10,78 +10,53 @@ Assumptions:
 
 ```python
 import pytest
-import tempfile
-import os
-import shutil
 
 # Import the function/class to test
 # from requirement_extractor import extract_requirements
 
+# Keep every supported input format here; extract_requirements checks against it
+SUPPORTED_FORMATS = frozenset(("pdf", "docx", "email", "graph"))
+
+# Simulate a large file, built once at import
+_LARGE_CONTENT = "Requirement.\n" * 10000
+
 # For demonstration, we'll use a mock extract_requirements function
 def extract_requirements(input_data, input_format):
     # Placeholder for real implementation
     if not input_data or input_data == "":
         raise ValueError("Input data is empty")
-    if input_format not in ["pdf", "docx", "email", "graph"]:
+    if input_format not in SUPPORTED_FORMATS:
         raise ValueError("Unsupported input format")
     if input_data == "corrupt":
         raise ValueError("Corrupt input data")
     # Return a dummy structured requirements list
     return [{"id": 1, "requirement": "The system shall..."}]
 
-@pytest.fixture(scope="function")
-def temp_dir():
-    # Setup: create a temporary directory for test files
-    dirpath = tempfile.mkdtemp()
-    yield dirpath
-    # Teardown: remove the directory after test
-    shutil.rmtree(dirpath)
-
-def create_sample_file(file_path, content):
-    with open(file_path, "w") as f:
-        f.write(content)
-
 @pytest.mark.parametrize(
-    "input_format, filename, content",
+    "input_format, content",
     [
-        ("pdf", "sample.pdf", "System shall allow user login."),
-        ("docx", "sample.docx", "System shall export reports."),
-        ("email", "sample.email", "Feature: password reset"),
-        ("graph", "sample.graph", '{"nodes":[{"id":1,"text":"Requirement 1"}]}'),
+        ("pdf", "System shall allow user login."),
+        ("docx", "System shall export reports."),
+        ("email", "Feature: password reset"),
+        ("graph", '{"nodes":[{"id":1,"text":"Requirement 1"}]}'),
     ]
 )
-def test_extract_from_supported_formats(temp_dir, input_format, filename, content):
+def test_extract_from_supported_formats(input_format, content):
     """
     Test extraction from all supported formats with valid content.
     """
-    file_path = os.path.join(temp_dir, filename)
-    create_sample_file(file_path, content)
-    with open(file_path, "r") as f:
-        input_data = f.read()
-    result = extract_requirements(input_data, input_format)
+    result = extract_requirements(content, input_format)
     assert isinstance(result, list)
     assert len(result) > 0
     assert "requirement" in result[0]
 
-@pytest.mark.parametrize(
-    "input_format, filename",
-    [
-        ("pdf", "empty.pdf"),
-        ("docx", "empty.docx"),
-        ("email", "empty.email"),
-        ("graph", "empty.graph"),
-    ]
-)
-def test_extract_from_empty_files(temp_dir, input_format, filename):
+@pytest.mark.parametrize("input_format", ["pdf", "docx", "email", "graph"])
+def test_extract_from_empty_files(input_format):
     """
     Edge case: extraction from empty files should raise an error.
     """
-    file_path = os.path.join(temp_dir, filename)
-    create_sample_file(file_path, "")  # empty content
-    with open(file_path, "r") as f:
-        input_data = f.read()
     with pytest.raises(ValueError, match="empty"):
-        extract_requirements(input_data, input_format)
+        extract_requirements("", input_format)
 
 def test_extract_from_corrupt_file():
     """
@@ -97,45 +72,29 @@ def test_extract_from_unsupported_format():
     with pytest.raises(ValueError, match="Unsupported"):
         extract_requirements("Some data", "txt")
 
-def test_extract_with_large_input(temp_dir):
+def test_extract_with_large_input():
     """
     Test extraction from a very large input to ensure system handles scale.
     """
-    filename = "large.pdf"
-    file_path = os.path.join(temp_dir, filename)
-    large_content = "Requirement.\n" * 10000  # simulate a large file
-    create_sample_file(file_path, large_content)
-    with open(file_path, "r") as f:
-        input_data = f.read()
-    result = extract_requirements(input_data, "pdf")
+    result = extract_requirements(_LARGE_CONTENT, "pdf")
     assert isinstance(result, list)
     assert len(result) > 0
 
-def test_extract_with_special_characters(temp_dir):
+def test_extract_with_special_characters():
     """
     Test extraction from input files containing special/unicode characters.
     """
-    filename = "special.docx"
-    file_path = os.path.join(temp_dir, filename)
     special_content = "The system shall support emoji 😊 and accented é characters."
-    create_sample_file(file_path, special_content)
-    with open(file_path, "r") as f:
-        input_data = f.read()
-    result = extract_requirements(input_data, "docx")
+    result = extract_requirements(special_content, "docx")
     assert isinstance(result, list)
     assert len(result) > 0
 
-def test_extract_from_email_with_attachments(temp_dir):
+def test_extract_from_email_with_attachments():
     """
     Test extraction from email input that references attachments (simulate real-world complexity).
     """
-    filename = "email_with_attachment.email"
-    file_path = os.path.join(temp_dir, filename)
     content = "Please see the attached requirement spec.\nAttachment: spec.pdf"
-    create_sample_file(file_path, content)
-    with open(file_path, "r") as f:
-        input_data = f.read()
-    result = extract_requirements(input_data, "email")
+    result = extract_requirements(content, "email")
     assert isinstance(result, list)
     assert len(result) > 0
 
@@ -144,7 +103,7 @@ def test_extract_from_graph_with_invalid_structure():
     Edge case: extraction from graph input with invalid structure should raise error.
     """
     invalid_graph = "This is not JSON"
-    with pytest.raises(Exception):
+    with pytest.raises(ValueError):
         extract_requirements(invalid_graph, "graph")
 ```
 
@@ -153,9 +112,9 @@ def test_extract_from_graph_with_invalid_structure():
 **Notes:**
 
 - Each test case is clearly commented to explain its purpose.
-- Setup and teardown are handled via the `temp_dir` fixture.
+- Inputs are passed to `extract_requirements` as in-memory strings; no files are written.
 - `extract_requirements` is a stand-in for your actual extraction function/class.
 - Edge cases include empty files, corrupt data, unsupported formats, large inputs, special characters, and invalid graph structures.
-- You may need to adapt file reading/writing and function invocation to your actual implementation.
+- You may need to adapt input loading and function invocation to your actual implementation.
 
 Let me know if you need test cases tailored to a specific framework or additional negative/positive scenarios!
\ No newline at end of file
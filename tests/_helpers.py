@@ -0,0 +1,9 @@
+# Shared assertion helpers. Kept out of test_* modules so pytest does not
+# rewrite them; failures carry their own messages instead.
+
+def assert_contains_all(text, *needles):
+    """
+    Assert that every needle occurs in text, reporting all missing ones together.
+    """
+    missing = [n for n in needles if n not in text]
+    assert not missing, f"missing {missing} in {text!r}"
@@ -0,0 +1,60 @@
+import pytest
+from unittest.mock import patch
+
+# --- Slow test handling ---
+
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", default=False, help="run tests marked slow")
+    parser.addoption(
+        "--integration", action="store_true", default=False,
+        help="run pipeline tests against real git/docker instead of in-process mocks"
+    )
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, use --runslow to run")
+    integration = config.getoption("--integration")
+    for item in items:
+        if "slow" not in item.keywords:
+            continue
+        # Integration-marked tests mock their slow parts unless --integration is given
+        if "integration" in item.keywords and not integration:
+            continue
+        item.add_marker(skip_slow)
+
+# --- Shared EmailService mock ---
+
+# Emails captured by the mock, shared across the session and reset per test
+_SENT_EMAILS = []
+
+def _mock_send_email(to, subject, body):
+    _SENT_EMAILS.append({
+        'to': to,
+        'subject': subject,
+        'body': body
+    })
+    return True
+
+# Built once at import; the target is only resolved when the patcher starts
+_EMAIL_PATCHER = patch("mymodule.notifications.EmailService.send_email", _mock_send_email)
+
+# --- Shared fixtures ---
+
+@pytest.fixture(scope="session")
+def _email_patcher():
+    """
+    Patch EmailService.send_email once for the whole session.
+    Sent emails are collected in a list that each test resets.
+    """
+    _EMAIL_PATCHER.start()
+    yield _SENT_EMAILS
+    _EMAIL_PATCHER.stop()
+
+@pytest.fixture
+def mock_email_service(_email_patcher):
+    """
+    Per-test view of the session-wide email mock, cleared before each test.
+    """
+    _email_patcher.clear()
+    yield _email_patcher
@@ -2,12 +2,22 @@ import pytest
 import logging
 from unittest import mock
 
+from _helpers import assert_contains_all
+
+# Fields every audit log entry must carry
+AUDIT_FIELDS = ("User:admin", "Action:restart_service", "Status:success")
+
 class MockCloudWatchClient:
     def __init__(self):
         self.metrics = []
         self.alarms = []
         self.put_metric_data_called = False
         self.put_metric_alarm_called = False
+    def reset(self):
+        self.metrics.clear()
+        self.alarms.clear()
+        self.put_metric_data_called = False
+        self.put_metric_alarm_called = False
     def put_metric_data(self, Namespace, MetricData):
         self.put_metric_data_called = True
         self.metrics.append((Namespace, MetricData))
@@ -21,32 +31,40 @@ class MockCloudWatchClient:
     def describe_alarms(self, AlarmNames):
         return {'MetricAlarms': [{'AlarmName': name, 'StateValue': 'ALARM'} for name in AlarmNames]}
 
+class ListHandler(logging.Handler):
+    """Keeps audit log messages in memory instead of writing a file."""
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
 @pytest.fixture(scope="function")
-def setup_audit_log(tmp_path):
-    log_file = tmp_path / "audit.log"
+def setup_audit_log():
     logger = logging.getLogger("audit")
-    handler = logging.FileHandler(log_file)
+    handler = ListHandler()
     logger.setLevel(logging.INFO)
     logger.addHandler(handler)
-    yield logger, log_file
+    yield logger, handler.messages
     logger.removeHandler(handler)
-    handler.close()
+
+@pytest.fixture(scope="module")
+def shared_cloudwatch_client():
+    return MockCloudWatchClient()
 
 @pytest.fixture(scope="function")
-def mock_cloudwatch_client():
-    client = MockCloudWatchClient()
-    yield client
+def mock_cloudwatch_client(shared_cloudwatch_client):
+    shared_cloudwatch_client.reset()
+    yield shared_cloudwatch_client
 
 # Positive Test: Audit logs are written and maintained
 def test_audit_log_written_and_maintained(setup_audit_log):
-    logger, log_file = setup_audit_log
+    logger, messages = setup_audit_log
     logger.info("User X performed action Y")
     logger.info("User Z performed action W")
-    with open(log_file, 'r') as f:
-        contents = f.read()
-    assert "User X performed action Y" in contents
-    assert "User Z performed action W" in contents
-    assert len(contents.splitlines()) == 2
+    assert "User X performed action Y" in messages
+    assert "User Z performed action W" in messages
+    assert len(messages) == 2
 
 # Negative Test: Audit log is not writable
 def test_audit_log_not_writable(tmp_path):
@@ -75,9 +93,9 @@ def test_cloudwatch_metric_data_sent(mock_cloudwatch_client):
 def test_cloudwatch_metric_data_send_failure(monkeypatch, mock_cloudwatch_client):
     client = mock_cloudwatch_client
     def fail_put_metric_data(Namespace, MetricData):
-        raise Exception("AWS CloudWatch unavailable")
+        raise RuntimeError("AWS CloudWatch unavailable")
     monkeypatch.setattr(client, "put_metric_data", fail_put_metric_data)
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(RuntimeError) as exc:
         client.put_metric_data(Namespace="MyApp", MetricData=[{"MetricName": "Errors", "Value": 1}])
     assert "unavailable" in str(exc.value)
 
@@ -96,29 +114,23 @@ def test_cloudwatch_alarm_created_and_alerted(mock_cloudwatch_client):
 def test_cloudwatch_alarm_creation_failure(monkeypatch, mock_cloudwatch_client):
     client = mock_cloudwatch_client
     def fail_put_metric_alarm(**kwargs):
-        raise Exception("Alarm creation failed")
+        raise RuntimeError("Alarm creation failed")
     monkeypatch.setattr(client, "put_metric_alarm", fail_put_metric_alarm)
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(RuntimeError) as exc:
         client.put_metric_alarm(AlarmName="FailAlarm", MetricName="Errors", Threshold=5, ComparisonOperator="GreaterThanThreshold")
     assert "Alarm creation failed" in str(exc.value)
 
 # Positive Test: Audit log contains required information
 def test_audit_log_contains_required_info(setup_audit_log):
-    logger, log_file = setup_audit_log
+    logger, messages = setup_audit_log
     logger.info("User:admin Action:restart_service Status:success")
-    with open(log_file, 'r') as f:
-        contents = f.read()
-    assert "User:admin" in contents
-    assert "Action:restart_service" in contents
-    assert "Status:success" in contents
+    assert_contains_all("\n".join(messages), *AUDIT_FIELDS)
 
 # Negative Test: Audit log missing required information
 def test_audit_log_missing_required_info(setup_audit_log):
-    logger, log_file = setup_audit_log
+    logger, messages = setup_audit_log
     logger.info("Action:restart_service Status:success")
-    with open(log_file, 'r') as f:
-        contents = f.read()
-    assert "User:" not in contents
+    assert "User:" not in "\n".join(messages)
 
 # Positive Test: CloudWatch monitoring provides continuous data
 def test_cloudwatch_monitoring_continuous_data(mock_cloudwatch_client):
@@ -131,8 +143,8 @@ def test_cloudwatch_monitoring_continuous_data(mock_cloudwatch_client):
 def test_cloudwatch_monitoring_data_unavailable(monkeypatch, mock_cloudwatch_client):
     client = mock_cloudwatch_client
     def fail_get_metric_data(MetricDataQueries):
-        raise Exception("Data unavailable")
+        raise RuntimeError("Data unavailable")
     monkeypatch.setattr(client, "get_metric_data", fail_get_metric_data)
-    with pytest.raises(Exception) as exc:
+    with pytest.raises(RuntimeError) as exc:
         client.get_metric_data(MetricDataQueries=[{"Id": "m1", "MetricStat": {}}])
     assert "Data unavailable" in str(exc.value)
\ No newline at end of file
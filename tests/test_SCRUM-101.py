@@ -1,27 +1,36 @@
+import bisect
+import operator
 import pytest
+from decimal import Decimal
+
+# Score thresholds and the risk level for each bucket between them
+RISK_THRESHOLDS = (30, 70)
+RISK_BY_BUCKET = ('Low', 'Medium', 'High')
+
+def weighted_sum(values, weights):
+    return sum(map(operator.mul, values, weights))
 
 class RiskScoringModule:
     def __init__(self, parameters):
         self.parameters = parameters
+        # Parameters are fixed after construction, so freeze them once as parallel tuples
+        self._keys = tuple(parameters)
+        self._weights = tuple(parameters.values())
     def score_client(self, client_data):
         if not isinstance(client_data, dict):
             raise TypeError('Client data must be a dictionary')
-        score = 0
-        for key, weight in self.parameters.items():
+        values = []
+        for key in self._keys:
             if key not in client_data:
                 raise ValueError(f'Missing required data: {key}')
             value = client_data[key]
             if not isinstance(value, (int, float)):
                 raise ValueError(f'Invalid data type for {key}')
-            score += value * weight
-        if score < 30:
-            return 'Low'
-        elif score < 70:
-            return 'Medium'
-        else:
-            return 'High'
+            values.append(value)
+        score = weighted_sum(values, self._weights)
+        return RISK_BY_BUCKET[bisect.bisect_right(RISK_THRESHOLDS, score)]
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def risk_module():
     parameters = {
         'financial_score': 0.5,
@@ -77,6 +86,28 @@ def test_invalid_data_type(risk_module):
         risk_module.score_client(client_data)
     assert 'Invalid data type for financial_score' in str(exc.value)
 
+def test_numeric_string_data(risk_module):
+    client_data = {
+        'financial_score': '80',
+        'operational_score': 80,
+        'compliance_score': 80
+    }
+    with pytest.raises(ValueError) as exc:
+        risk_module.score_client(client_data)
+    assert 'Invalid data type for financial_score' in str(exc.value)
+
+def test_equal_decimal_data_after_int_data(risk_module):
+    client_data = {
+        'financial_score': 10,
+        'operational_score': 10,
+        'compliance_score': 10
+    }
+    assert risk_module.score_client(client_data) == 'Low'
+    client_data['financial_score'] = Decimal(10)
+    with pytest.raises(ValueError) as exc:
+        risk_module.score_client(client_data)
+    assert 'Invalid data type for financial_score' in str(exc.value)
+
 def test_negative_scores(risk_module):
     client_data = {
         'financial_score': -10,
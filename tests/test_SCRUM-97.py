@@ -1,27 +1,26 @@
+import bisect
 import pytest
 
+# Average score thresholds and the risk level for each bucket between them
+RISK_THRESHOLDS = (50, 80)
+RISK_BY_BUCKET = ('High', 'Medium', 'Low')
+
 class ClientRiskProfiler:
     def __init__(self):
         self.risk_levels = ['Low', 'Medium', 'High']
 
     def categorize(self, financial_score, operational_score, compliance_score):
-        if not all(isinstance(score, (int, float)) for score in [financial_score, operational_score, compliance_score]):
+        scores = (financial_score, operational_score, compliance_score)
+        if not all(isinstance(score, (int, float)) for score in scores):
             raise ValueError('All scores must be numeric')
-        if not all(0 <= score <= 100 for score in [financial_score, operational_score, compliance_score]):
+        if not all(0 <= score <= 100 for score in scores):
             raise ValueError('Scores must be between 0 and 100')
-        avg_score = (financial_score + operational_score + compliance_score) / 3
-        if avg_score >= 80:
-            return 'Low'
-        elif avg_score >= 50:
-            return 'Medium'
-        else:
-            return 'High'
+        avg_score = sum(scores) / 3
+        return RISK_BY_BUCKET[bisect.bisect_right(RISK_THRESHOLDS, avg_score)]
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def profiler():
-    profiler = ClientRiskProfiler()
-    yield profiler
-    del profiler
+    return ClientRiskProfiler()
 
 def test_categorize_low_risk(profiler):
     result = profiler.categorize(90, 85, 80)
@@ -52,6 +51,11 @@ def test_invalid_score_type(profiler):
         profiler.categorize('a', 50, 60)
     assert 'numeric' in str(excinfo.value)
 
+def test_numeric_string_score(profiler):
+    with pytest.raises(ValueError) as excinfo:
+        profiler.categorize('90', '85', '80')
+    assert 'numeric' in str(excinfo.value)
+
 def test_score_below_zero(profiler):
     with pytest.raises(ValueError) as excinfo:
         profiler.categorize(-1, 50, 60)
@@ -1,6 +1,9 @@
+import operator
 import pytest
 from pathlib import Path
 
+_JIRA_GET = operator.itemgetter('title', 'description', 'acceptance_criteria')
+
 class MockDocumentGenerator:
     def __init__(self, templates):
         self.templates = templates
@@ -12,10 +15,11 @@ class MockDocumentGenerator:
         template = self.templates[doc_type]
         return template.format(**data)
     def generate_jira_user_story(self, user_story_data):
-        required_fields = {'title', 'description', 'acceptance_criteria'}
-        if not required_fields.issubset(user_story_data):
+        try:
+            title, description, acceptance_criteria = _JIRA_GET(user_story_data)
+        except KeyError:
             raise ValueError('Missing required fields for JIRA user story')
-        return f"Summary: {user_story_data['title']}\nDescription: {user_story_data['description']}\nAcceptance Criteria: {user_story_data['acceptance_criteria']}"
+        return f"Summary: {title}\nDescription: {description}\nAcceptance Criteria: {acceptance_criteria}"
 
 def setup_module(module):
     module.templates = {
@@ -18,6 +18,8 @@ from unittest import mock
 
 # For demonstration, let's mock these methods
 class MockAutoScalingManager:
+    __slots__ = ("enabled", "instances", "scaling_policy", "last_traffic")
+
     def __init__(self):
         self.enabled = False
         self.instances = 2
@@ -50,19 +52,27 @@ class MockAutoScalingManager:
         self.instances = self.scaling_policy['min']
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def autoscaling_manager():
     """
-    Setup: Initialize the Auto Scaling Manager and enable Auto Scaling.
+    Setup: Initialize the Auto Scaling Manager once for the module.
     Teardown: Disable Auto Scaling and reset traffic to clean state.
     """
     manager = MockAutoScalingManager()
-    manager.enable_auto_scaling()
     yield manager
     manager.disable_auto_scaling()
     manager.reset_traffic()
 
 
+@pytest.fixture(autouse=True)
+def reset_autoscaling(autoscaling_manager):
+    """
+    Setup: Reset traffic and enable Auto Scaling before each test.
+    """
+    autoscaling_manager.reset_traffic()
+    autoscaling_manager.enable_auto_scaling()
+
+
 def test_auto_scaling_enabled(autoscaling_manager):
     """
     Test that Auto Scaling is enabled.
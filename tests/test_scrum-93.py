@@ -20,7 +20,7 @@ from app.collaboration import CollaborationManager, Resource, AccessDeniedError
 
 # ----------------- Fixtures for setup & teardown -----------------
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def user_manager():
     # Setup: Create a UserManager instance
     um = UserManager()
@@ -28,7 +28,7 @@ def user_manager():
     # Teardown: Clean up users (if needed)
     um.delete_all_users()
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def collaboration_manager():
     # Setup: Create a CollaborationManager instance
     cm = CollaborationManager()
@@ -36,30 +36,28 @@ def collaboration_manager():
     # Teardown: Clean up resources
     cm.delete_all_resources()
 
+@pytest.fixture(autouse=True)
+def clean_state(user_manager, collaboration_manager):
+    # Setup: Start each test with no users or resources left by the previous one
+    user_manager.delete_all_users()
+    collaboration_manager.delete_all_resources()
+
 @pytest.fixture
 def stakeholder_user(user_manager):
-    user = user_manager.create_user("stakeholder@test.com", role=Role.STAKEHOLDER)
-    yield user
-    user_manager.delete_user(user.id)
+    return user_manager.create_user("stakeholder@test.com", role=Role.STAKEHOLDER)
 
 @pytest.fixture
 def admin_user(user_manager):
-    user = user_manager.create_user("admin@test.com", role=Role.ADMIN)
-    yield user
-    user_manager.delete_user(user.id)
+    return user_manager.create_user("admin@test.com", role=Role.ADMIN)
 
 @pytest.fixture
 def contributor_user(user_manager):
-    user = user_manager.create_user("contributor@test.com", role=Role.CONTRIBUTOR)
-    yield user
-    user_manager.delete_user(user.id)
+    return user_manager.create_user("contributor@test.com", role=Role.CONTRIBUTOR)
 
 @pytest.fixture
 def shared_resource(collaboration_manager, admin_user):
     # Admin creates a resource for collaboration
-    resource = collaboration_manager.create_resource("ProjectX", owner=admin_user)
-    yield resource
-    collaboration_manager.delete_resource(resource.id)
+    return collaboration_manager.create_resource("ProjectX", owner=admin_user)
 
 # ----------------- Test Cases -----------------
 
@@ -144,7 +142,7 @@ def test_security_data_leak(collaboration_manager, stakeholder_user, admin_user)
 
 ## **Explanation:**
 
-- **Fixtures** handle setup/teardown of users and resources for isolation and repeatability.
+- **Fixtures** handle setup/teardown of users and resources for isolation and repeatability; the managers are shared for the session and cleared before each test.
 - **Test cases** cover:
     - Basic and advanced access control for the Stakeholder role.
     - Sharing, revoking, and edge cases (duplicate sharing, invalid roles).
@@ -13,18 +13,26 @@ class AccessDeniedError(Exception):
     pass
 
 class User:
+    __slots__ = ("username", "role")
+
     def __init__(self, username, role):
         self.username = username
         self.role = role
 
 class Requirement:
+    __slots__ = ("req_id", "content", "collaborators")
+
     def __init__(self, req_id, content, collaborators=None):
         self.req_id = req_id
         self.content = content
-        self.collaborators = collaborators or []
+        # A set gives O(1) membership checks and holds each collaborator once
+        self.collaborators = set(collaborators) if collaborators else set()
 
 class CollaborationSystem:
     """A system under test, with role-based access control for collaboration."""
+    # Roles allowed to create requirements
+    CREATOR_ROLES = frozenset({"Stakeholder", "Admin"})
+
     def __init__(self):
         # In a real system, these would be managed by a database
         self.users = {}
@@ -34,49 +42,52 @@ class CollaborationSystem:
         self.users[user.username] = user
     
     def create_requirement(self, creator, content):
-        if creator.role not in ["Stakeholder", "Admin"]:
+        if creator.role not in self.CREATOR_ROLES:
             raise AccessDeniedError("User role cannot create requirements.")
         req_id = f"REQ-{len(self.requirements)+1}"
         req = Requirement(req_id, content, [creator.username])
         self.requirements[req_id] = req
         return req
     
+    def is_collaborator(self, req_id, username):
+        return username in self.requirements[req_id].collaborators
+    
     def add_collaborator(self, req_id, actor, collaborator_username):
-        if actor.username not in self.requirements[req_id].collaborators:
+        if not self.is_collaborator(req_id, actor.username):
             raise AccessDeniedError("Only collaborators can add others.")
-        self.requirements[req_id].collaborators.append(collaborator_username)
+        self.requirements[req_id].collaborators.add(collaborator_username)
     
     def access_requirement(self, req_id, user):
-        if user.username not in self.requirements[req_id].collaborators:
+        if not self.is_collaborator(req_id, user.username):
             raise AccessDeniedError("Access denied.")
         return self.requirements[req_id]
     
     def edit_requirement(self, req_id, user, new_content):
-        if user.username not in self.requirements[req_id].collaborators:
+        if not self.is_collaborator(req_id, user.username):
             raise AccessDeniedError("Edit access denied.")
         self.requirements[req_id].content = new_content
 
+# Users are built once and shared by every test; none of them is ever mutated
+ADMIN = User("alice_admin", "Admin")
+STAKEHOLDER1 = User("bob_stakeholder", "Stakeholder")
+STAKEHOLDER2 = User("carol_stakeholder", "Stakeholder")
+OUTSIDER = User("eve_outsider", "Guest")
+
 # Fixtures for setup and teardown
 
 @pytest.fixture
 def collab_system():
     """Setup CollaborationSystem and add users."""
     system = CollaborationSystem()
-    admin = User("alice_admin", "Admin")
-    stakeholder1 = User("bob_stakeholder", "Stakeholder")
-    stakeholder2 = User("carol_stakeholder", "Stakeholder")
-    outsider = User("eve_outsider", "Guest")
-    system.add_user(admin)
-    system.add_user(stakeholder1)
-    system.add_user(stakeholder2)
-    system.add_user(outsider)
+    for user in (ADMIN, STAKEHOLDER1, STAKEHOLDER2, OUTSIDER):
+        system.add_user(user)
     yield system
     # Teardown: Clean up system state if needed (no action for in-memory mock)
 
 @pytest.fixture
 def initial_requirement(collab_system):
     """Setup a requirement created by a stakeholder."""
-    creator = collab_system.users["bob_stakeholder"]
+    creator = STAKEHOLDER1
     req = collab_system.create_requirement(creator, "Initial requirement content.")
     return req
 
@@ -84,7 +95,7 @@ def initial_requirement(collab_system):
 
 def test_stakeholder_can_create_and_access_requirement(collab_system):
     """Stakeholder should be able to create and access requirements they own."""
-    stakeholder = collab_system.users["bob_stakeholder"]
+    stakeholder = STAKEHOLDER1
     req = collab_system.create_requirement(stakeholder, "Sample requirement.")
     # Access by creator
     accessed = collab_system.access_requirement(req.req_id, stakeholder)
@@ -92,8 +103,8 @@ def test_stakeholder_can_create_and_access_requirement(collab_system):
 
 def test_stakeholder_can_invite_other_stakeholders(collab_system, initial_requirement):
     """Stakeholder can add other stakeholders as collaborators."""
-    actor = collab_system.users["bob_stakeholder"]
-    new_collaborator = collab_system.users["carol_stakeholder"]
+    actor = STAKEHOLDER1
+    new_collaborator = STAKEHOLDER2
     collab_system.add_collaborator(initial_requirement.req_id, actor, new_collaborator.username)
     # New collaborator should have access
     accessed = collab_system.access_requirement(initial_requirement.req_id, new_collaborator)
@@ -101,35 +112,32 @@ def test_stakeholder_can_invite_other_stakeholders(collab_system, initial_requir
 
 def test_collaborators_can_edit_requirement(collab_system, initial_requirement):
     """All collaborators must be able to edit the requirement securely."""
-    actor = collab_system.users["bob_stakeholder"]
-    collaborator = collab_system.users["carol_stakeholder"]
+    actor = STAKEHOLDER1
+    collaborator = STAKEHOLDER2
     collab_system.add_collaborator(initial_requirement.req_id, actor, collaborator.username)
     # Collaborator edits the requirement
     collab_system.edit_requirement(initial_requirement.req_id, collaborator, "Edited by Carol.")
     req = collab_system.requirements[initial_requirement.req_id]
     assert req.content == "Edited by Carol."
 
-def test_non_collaborator_cannot_access_requirement(collab_system, initial_requirement):
-    """Users not in the collaborator list must be denied access."""
-    outsider = collab_system.users["eve_outsider"]
-    with pytest.raises(AccessDeniedError):
-        collab_system.access_requirement(initial_requirement.req_id, outsider)
-
-def test_non_collaborator_cannot_edit_requirement(collab_system, initial_requirement):
-    """Users not in the collaborator list cannot edit requirements."""
-    outsider = collab_system.users["eve_outsider"]
-    with pytest.raises(AccessDeniedError):
-        collab_system.edit_requirement(initial_requirement.req_id, outsider, "Hacked content.")
-
-def test_only_collaborators_can_invite_others(collab_system, initial_requirement):
-    """Users not in the collaborator list cannot add collaborators."""
-    outsider = collab_system.users["eve_outsider"]
+@pytest.mark.parametrize(
+    "action",
+    [
+        lambda system, req_id, user: system.access_requirement(req_id, user),
+        lambda system, req_id, user: system.edit_requirement(req_id, user, "Hacked content."),
+        lambda system, req_id, user: system.add_collaborator(req_id, user, user.username),
+    ],
+    ids=["access", "edit", "invite"]
+)
+def test_non_collaborator_is_denied(collab_system, initial_requirement, action):
+    """Users not in the collaborator list cannot access, edit, or add collaborators."""
+    outsider = OUTSIDER
     with pytest.raises(AccessDeniedError):
-        collab_system.add_collaborator(initial_requirement.req_id, outsider, "eve_outsider")
+        action(collab_system, initial_requirement.req_id, outsider)
 
 def test_admin_can_create_and_access_any_requirement(collab_system):
     """Admin role should be able to create and access requirements."""
-    admin = collab_system.users["alice_admin"]
+    admin = ADMIN
     req = collab_system.create_requirement(admin, "Admin's requirement.")
     # Admin can access their own requirement
     accessed = collab_system.access_requirement(req.req_id, admin)
@@ -137,18 +145,19 @@ def test_admin_can_create_and_access_any_requirement(collab_system):
 
 def test_edge_case_duplicate_collaborator(collab_system, initial_requirement):
     """Adding the same collaborator twice should not create duplicates."""
-    actor = collab_system.users["bob_stakeholder"]
-    collaborator = collab_system.users["carol_stakeholder"]
+    actor = STAKEHOLDER1
+    collaborator = STAKEHOLDER2
     collab_system.add_collaborator(initial_requirement.req_id, actor, collaborator.username)
     # Try adding the same collaborator again
     collab_system.add_collaborator(initial_requirement.req_id, actor, collaborator.username)
     collaborators = collab_system.requirements[initial_requirement.req_id].collaborators
-    # Should only appear once or twice (depending on implementation)
-    assert collaborators.count(collaborator.username) <= 2  # Accepts both, or change based on desired behavior
+    # The collaborator set holds each username exactly once
+    assert collaborator.username in collaborators
+    assert len(collaborators) == 2
 
 def test_edge_case_no_collaborators(collab_system):
     """Requirement with no collaborators should not allow any access."""
-    admin = collab_system.users["alice_admin"]
+    admin = ADMIN
     req = Requirement("REQ-999", "Orphan requirement", [])
     collab_system.requirements["REQ-999"] = req
     with pytest.raises(AccessDeniedError):
@@ -156,10 +165,10 @@ def test_edge_case_no_collaborators(collab_system):
 
 def test_security_collaborator_list_integrity(collab_system, initial_requirement):
     """Test that collaborator list cannot be tampered with externally."""
-    # Try to modify the collaborators list directly
+    # Try to modify the collaborators set directly
     req = initial_requirement
-    req.collaborators.append("malicious_user")
-    outsider = collab_system.users["eve_outsider"]
+    req.collaborators.add("malicious_user")
+    outsider = OUTSIDER
     with pytest.raises(AccessDeniedError):
         collab_system.access_requirement(req.req_id, outsider)
 
@@ -10,7 +10,6 @@ Here is the code:
 
 ```python
 import pytest
-import tempfile
 import shutil
 import os
 
@@ -19,7 +18,7 @@ from requirement_extractor import extract_requirements, is_structured
 
 # Fixtures for setup and teardown
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def sample_documents(tmp_path_factory):
     """
     Setup: Create sample documents of each supported type with known structured content.
@@ -54,6 +53,19 @@ def sample_documents(tmp_path_factory):
     samples['graph'] = str(graph_path)
     return samples
 
+@pytest.fixture(scope="session")
+def invalid_documents(tmp_path_factory):
+    """
+    Setup: Create the corrupted PDFs used by the accuracy test once per session.
+    """
+    base_dir = tmp_path_factory.mktemp("invalid_docs")
+    paths = []
+    for i in range(4):
+        path = base_dir / f"invalid_{i}.pdf"
+        path.write_bytes(b"Not a real PDF")
+        paths.append(str(path))
+    return paths
+
 # Main functionality: Test extraction for all formats
 @pytest.mark.parametrize("doc_type", ["pdf", "docx", "eml", "graph"])
 def test_extract_supported_formats(sample_documents, doc_type):
@@ -65,29 +77,18 @@ def test_extract_supported_formats(sample_documents, doc_type):
     assert is_structured(result), f"Extracted data from {doc_type} is not structured as expected"
     assert result, f"No requirements extracted from {doc_type}"
 
-def test_extraction_accuracy(sample_documents):
+@pytest.mark.slow
+def test_extraction_accuracy(sample_documents, invalid_documents):
     """
     Test that the extraction succeeds for at least 95% of uploaded documents (acceptance criteria).
     Here, we simulate with 20 documents (5 of each type), 1 known bad PDF.
     """
-    total = 20
-    success = 0
-    # Simulate 4 valid docs of each type, total 16, and 4 invalid ones
-    for i in range(4):
-        for doc_type, path in sample_documents.items():
-            result = extract_requirements(path)
-            if is_structured(result):
-                success += 1
-
-    # Add 4 invalid docs (simulate corrupted/unsupported files)
-    for i in range(4):
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"Not a real PDF")
-            path = f.name
-        result = extract_requirements(path)
-        if is_structured(result):
-            success += 1
-        os.unlink(path)
+    # Simulate 4 valid docs of each type, total 16, and 4 invalid ones (corrupted/unsupported files)
+    documents = list(sample_documents.values()) * 4 + invalid_documents
+    total = len(documents)
+    # Repeated paths are the same file, so extract and validate each distinct one once
+    outcomes = {path: is_structured(extract_requirements(path)) for path in set(documents)}
+    success = sum(outcomes[path] for path in documents)
 
     assert success / total >= 0.95, f"Extraction succeeded for only {success}/{total} documents"
 
@@ -118,17 +119,20 @@ def test_unsupported_format(tmp_path):
     """
     unsupported_file = tmp_path / "unsupported.txt"
     unsupported_file.write_text("This is a plain text file.")
-    with pytest.raises(Exception):
+    with pytest.raises(ValueError):
         extract_requirements(str(unsupported_file))
 
 # Edge case: Large document
+@pytest.mark.slow
 def test_large_document(tmp_path):
     """
-    Test extraction from a very large document (simulate by repeating content).
+    Test extraction from a very large document: a PDF header and one requirement
+    line followed by a ~10 MB sparse tail of NUL bytes.
     """
     large_file = tmp_path / "large.pdf"
-    content = b"%PDF-1.4\n" + b"Requirement: The system shall...\n" * 10000
-    large_file.write_bytes(content)
+    large_file.write_bytes(b"%PDF-1.4\nRequirement: The system shall...\n")
+    # Extend to 10 MB as a sparse file; the tail is never built in memory or written
+    os.truncate(large_file, 10 * 1024 * 1024)
     result = extract_requirements(str(large_file))
     assert is_structured(result), "Extractor failed to handle large document"
     assert result, "Extractor failed to extract requirements from large document"